@@ -19,24 +19,35 @@ Controls:
     Ctrl+C    = exit
 """
 
+from __future__ import annotations
+
 import sys
-import os
 import argparse
+import hashlib
+import os
 import termios
 import tty
-import select
+import queue
+import selectors
+import shutil
 import subprocess
+import threading
 import time
-import tempfile
-import wave
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
-import numpy as np
-import sounddevice as sd
-from faster_whisper import WhisperModel
+# numpy/sounddevice/faster-whisper dlopen a lot of shared libraries; defer
+# them into the functions that need them so `ptt --help` stays instant.
+if TYPE_CHECKING:
+    import numpy as np
+    from faster_whisper import WhisperModel
 
 SAMPLE_RATE = 16000
 CHANNELS = 1
 RELEASE_TIMEOUT = 0.25
+FRAME_HOP = 160          # 10 ms at 16 kHz
+SILENCE_RMS = 300.0      # int16 scale; below this a frame counts as silence
+TRANSCRIPT_CACHE_SIZE = 256
 DEFAULT_MODEL = "base"
 DEFAULT_LANGUAGE = "pl"
 
@@ -51,102 +62,206 @@ CLR = "\033[2K\r"
 
 
 def load_model(model_size: str = DEFAULT_MODEL) -> WhisperModel:
-    sys.stderr.write(f"{CYAN}Loading Whisper model '{model_size}'...{RESET}\n")
-    model = WhisperModel(model_size, device="cpu", compute_type="int8")
+    import numpy as np
+    from faster_whisper import WhisperModel
+
+    # An NVIDIA GPU beats any CPU tuning by a wide margin; probe cheaply
+    # and fall through to CPU when absent.
+    device = "cuda" if shutil.which("nvidia-smi") else "cpu"
+    sys.stderr.write(f"{CYAN}Loading Whisper model '{model_size}' ({device})...{RESET}\n")
+    try:
+        # int8_float16 uses tensor cores on CUDA; int8_float32 uses VNNI
+        # int8 GEMM with float32 accumulation where the CPU supports it.
+        model = WhisperModel(
+            model_size, device=device, device_index=0,
+            compute_type="int8_float16" if device == "cuda" else "int8_float32",
+            cpu_threads=os.cpu_count() or 4, num_workers=1,
+        )
+    except (ValueError, RuntimeError):
+        model = WhisperModel(model_size, device="cpu", compute_type="int8")
     model.language = DEFAULT_LANGUAGE  # type: ignore[attr-defined]
+    # Warm-up pass on 1 s of silence: pays the lazy CTranslate2 kernel
+    # dispatch / mel-filter setup here instead of on the first utterance.
+    try:
+        segments, _ = model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32),
+            language=DEFAULT_LANGUAGE, beam_size=1, vad_filter=False,
+        )
+        for _ in segments:
+            pass
+    except Exception:
+        pass  # warm-up is best-effort; real transcription will still work
     sys.stderr.write(f"{GREEN}Model ready.{RESET}\n")
     return model
 
 
+def trim_silence(audio: np.ndarray, threshold: float = SILENCE_RMS) -> np.ndarray:
+    """Cut leading/trailing silence using per-10ms-frame RMS.
+
+    Returns a (possibly empty) view of *audio*; cheap single vectorized
+    pass, so dead air never reaches the model.
+    """
+    import numpy as np
+
+    n_frames = len(audio) // FRAME_HOP
+    if n_frames == 0:
+        return audio
+    frames = audio[:n_frames * FRAME_HOP].astype(np.float32).reshape(n_frames, FRAME_HOP)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    voiced = np.flatnonzero(rms > threshold)
+    if len(voiced) == 0:
+        return audio[:0]
+    start = voiced[0] * FRAME_HOP
+    end = min(len(audio), (voiced[-1] + 1) * FRAME_HOP)
+    return audio[start:end]
+
+
 def transcribe(model: WhisperModel, audio_data: np.ndarray) -> str:
+    import numpy as np
+
     if len(audio_data) == 0:
         return ""
     language = getattr(model, "language", DEFAULT_LANGUAGE)
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp_path = tmp.name
-        with wave.open(tmp, "wb") as wf:
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(2)
-            wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(audio_data.tobytes())
+    # faster-whisper accepts a float32 ndarray directly — no temp WAV,
+    # no ffmpeg decode, no resample of audio that is already 16 kHz mono.
+    # Fused cast+scale in one SIMD pass; plain `/ 32768.0` would round-trip
+    # through float64.
+    audio_f32 = np.multiply(audio_data, np.float32(1.0 / 32768.0), dtype=np.float32)
+    # No VAD: the user already delimited the speech by holding/releasing
+    # the key, so Silero inference would add latency for nothing.
+    segments, _info = model.transcribe(
+        audio_f32,
+        language=language,
+        beam_size=1,
+        vad_filter=False,
+    )
+    return " ".join(seg.text for seg in segments).strip()
 
-    try:
+
+def make_transcriber(model: WhisperModel):
+    """Return a transcribe(audio_int16) closure specialized for *model*.
+
+    Captures the language, the int16 scale constant and a reusable float32
+    scratch buffer once, so the per-utterance call does no getattr chain
+    and no fresh conversion-buffer allocation.
+    """
+    import numpy as np
+
+    language = getattr(model, "language", DEFAULT_LANGUAGE)
+    scale = np.float32(1.0 / 32768.0)
+    scratch = np.empty(SAMPLE_RATE * Recorder.BUF_SECONDS, dtype=np.float32)
+
+    def _transcribe(audio_data: np.ndarray) -> str:
+        n = len(audio_data)
+        if n == 0:
+            return ""
+        if n <= scratch.size:
+            audio_f32 = scratch[:n]
+            np.multiply(audio_data, scale, out=audio_f32)
+        else:
+            audio_f32 = np.multiply(audio_data, scale, dtype=np.float32)
         segments, _info = model.transcribe(
-            tmp_path,
+            audio_f32,
             language=language,
             beam_size=1,
-            vad_filter=True,
-            vad_parameters={"min_silence_duration_ms": 300, "speech_pad_ms": 200},
+            vad_filter=False,
         )
-        text = " ".join(seg.text for seg in segments).strip()
-    finally:
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
+        return " ".join(seg.text for seg in segments).strip()
+
+    return _transcribe
+
 
-    return text
+# Resolved once: avoids a PATH walk (and the failed-exec error path when
+# wtype is missing) on every utterance.
+_WTYPE_BIN = shutil.which("wtype")
 
 
 def wtype_text(text: str):
     """Type text into the previously active window using wtype."""
-    try:
-        subprocess.run(["wtype", "--", text], check=True, timeout=5)
-    except FileNotFoundError:
+    if _WTYPE_BIN is None:
         sys.stderr.write(f"{RED}wtype not found! Install: sudo apt install wtype{RESET}\n")
+        return
+    try:
+        subprocess.run([_WTYPE_BIN, "--", text], check=True, timeout=5)
     except subprocess.CalledProcessError as e:
         sys.stderr.write(f"{RED}wtype error: {e}{RESET}\n")
 
 
 class Recorder:
+    # Pre-sized recording arena: 60 s covers any sane PTT utterance and
+    # avoids per-block allocations; doubled on overflow.
+    BUF_SECONDS = 60
+
     def __init__(self):
-        self.frames = []
+        import numpy as np
+
+        self.buf = np.empty(SAMPLE_RATE * self.BUF_SECONDS, dtype=np.int16)
+        self.write_idx = 0
         self.recording = False
         self.stream = None
 
     def start(self):
-        self.frames = []
+        self.write_idx = 0
+        if self.stream is None:
+            # Opened once and kept running across utterances — PortAudio
+            # open/close and device negotiation cost tens of ms per press.
+            # The callback drops blocks while self.recording is False.
+            import sounddevice as sd
+
+            self.stream = sd.InputStream(
+                samplerate=SAMPLE_RATE,
+                channels=CHANNELS,
+                dtype="int16",
+                blocksize=1024,
+                callback=self._callback,
+            )
+            self.stream.start()
         self.recording = True
-        self.stream = sd.InputStream(
-            samplerate=SAMPLE_RATE,
-            channels=CHANNELS,
-            dtype="int16",
-            blocksize=1024,
-            callback=self._callback,
-        )
-        self.stream.start()
 
     def _callback(self, indata, frame_count, time_info, status):
-        if self.recording:
-            self.frames.append(indata.copy())
+        import numpy as np
+
+        if not self.recording:
+            return
+        n = len(indata)
+        if self.write_idx + n > self.buf.size:
+            self.buf = np.resize(self.buf, max(self.buf.size * 2, self.write_idx + n))
+        # One memcpy straight out of the PortAudio buffer into our arena —
+        # no new ndarray object allocated on the realtime audio thread.
+        np.copyto(self.buf[self.write_idx:self.write_idx + n], indata[:, 0])
+        self.write_idx += n
 
     def stop(self) -> np.ndarray:
+        self.recording = False
+        return self.buf[:self.write_idx]
+
+    def close(self):
         self.recording = False
         if self.stream:
             self.stream.stop()
             self.stream.close()
             self.stream = None
-        if self.frames:
-            return np.concatenate(self.frames, axis=0).flatten()
-        return np.array([], dtype=np.int16)
 
 
-def is_key_pressed(trigger_char: str, timeout: float = 0.05) -> bool:
-    rlist, _, _ = select.select([sys.stdin], [], [], timeout)
-    if rlist:
-        ch = sys.stdin.read(1)
-        while select.select([sys.stdin], [], [], 0.01)[0]:
-            sys.stdin.read(1)
-        if trigger_char == " ":
-            return ch == " "
-        return ch.lower() == trigger_char.lower()
-    return False
+def is_key_pressed(sel: selectors.BaseSelector, trigger_char: str, timeout: float = 0.05) -> bool:
+    if not sel.select(timeout):
+        return False
+    # One unbuffered read drains the whole autorepeat burst in a single
+    # syscall (vs. a read(1) + 10 ms select per repeated key).
+    data = os.read(sys.stdin.fileno(), 4096)
+    if b"\x03" in data:
+        raise KeyboardInterrupt
+    ch = data[:1].decode(errors="replace")
+    if trigger_char == " ":
+        return ch == " "
+    return ch.lower() == trigger_char.lower()
 
 
 def run(args):
     model = load_model(args.model)
     recorder = Recorder()
+    do_transcribe = make_transcriber(model)
     trigger = args.key
     trigger_label = "SPACE" if trigger == " " else trigger.upper()
     mode = args.mode
@@ -163,30 +278,54 @@ def run(args):
     )
 
     old_settings = termios.tcgetattr(sys.stdin)
+    # Inference runs on a daemon thread with a queue handoff, not an
+    # executor: executor workers are non-daemon and joined at interpreter
+    # exit, which would turn Ctrl+C during a transcription into a hang
+    # until the model finished.  A daemon thread just dies with us.
+    stt_jobs: queue.Queue = queue.Queue()
+    stt_results: queue.Queue = queue.Queue()
+
+    def stt_worker() -> None:
+        while True:
+            job = stt_jobs.get()
+            try:
+                stt_results.put(("ok", do_transcribe(job)))
+            except Exception as exc:  # surfaced in the main loop
+                stt_results.put(("err", exc))
+
+    threading.Thread(target=stt_worker, daemon=True, name="ptt-stt").start()
+    # One selector registered once — epoll on Linux — instead of a fresh
+    # select.select() fd set built on every poll iteration.
+    sel = selectors.DefaultSelector()
+    sel.register(sys.stdin, selectors.EVENT_READ)
+    # PTT users repeat short commands; an LRU keyed on the raw PCM lets an
+    # identical capture skip the model entirely.
+    transcript_cache: OrderedDict = OrderedDict()
+
+    # The two prompts redrawn every loop iteration never change — encode
+    # them once and emit with a single unbuffered write (no f-string
+    # formatting, no encode, no flush per redraw).
+    ready_bytes = f"{CLR}{CYAN}[ Ready ] Hold {trigger_label} to speak...{RESET}".encode()
+    rec_bytes = f"{CLR}{RED}{BOLD}[ REC ] Recording... release {trigger_label} to stop{RESET}".encode()
 
     try:
         tty.setcbreak(sys.stdin.fileno())
 
         while True:
-            sys.stderr.write(f"{CLR}{CYAN}[ Ready ] Hold {trigger_label} to speak...{RESET}")
-            sys.stderr.flush()
+            os.write(2, ready_bytes)
 
-            while not is_key_pressed(trigger):
+            while not is_key_pressed(sel, trigger):
                 pass
 
             recorder.start()
-            sys.stderr.write(f"{CLR}{RED}{BOLD}[ REC ] Recording... release {trigger_label} to stop{RESET}")
-            sys.stderr.flush()
+            os.write(2, rec_bytes)
 
             last_key_time = time.monotonic()
             while True:
-                rlist, _, _ = select.select([sys.stdin], [], [], 0.05)
-                if rlist:
-                    ch = sys.stdin.read(1)
-                    if ch == "\x03":
+                if sel.select(0.05):
+                    data = os.read(sys.stdin.fileno(), 4096)
+                    if b"\x03" in data:
                         raise KeyboardInterrupt
-                    while select.select([sys.stdin], [], [], 0.01)[0]:
-                        sys.stdin.read(1)
                     last_key_time = time.monotonic()
                 else:
                     if time.monotonic() - last_key_time > RELEASE_TIMEOUT:
@@ -199,10 +338,35 @@ def run(args):
                 sys.stderr.write(f"{CLR}{YELLOW}[ Skip ] Too short ({duration:.1f}s){RESET}\n")
                 continue
 
-            sys.stderr.write(f"{CLR}{YELLOW}[ ... ] Transcribing {duration:.1f}s...{RESET}")
-            sys.stderr.flush()
+            audio = trim_silence(audio)
+            if len(audio) < 0.3 * SAMPLE_RATE:
+                sys.stderr.write(f"{CLR}{YELLOW}[ Skip ] Silence only{RESET}\n")
+                continue
 
-            text = transcribe(model, audio)
+            audio_key = hashlib.blake2b(audio.tobytes(), digest_size=16).digest()
+            if audio_key in transcript_cache:
+                transcript_cache.move_to_end(audio_key)
+                text = transcript_cache[audio_key]
+            else:
+                stt_jobs.put(audio)
+
+                sys.stderr.write(f"{CLR}{YELLOW}[ ... ] Transcribing {duration:.1f}s...{RESET}")
+                sys.stderr.flush()
+
+                # Short-timeout poll keeps KeyboardInterrupt responsive
+                # while the worker grinds through the model.
+                while True:
+                    try:
+                        status, payload = stt_results.get(timeout=0.1)
+                        break
+                    except queue.Empty:
+                        continue
+                if status == "err":
+                    raise payload
+                text = payload
+                transcript_cache[audio_key] = text
+                if len(transcript_cache) > TRANSCRIPT_CACHE_SIZE:
+                    transcript_cache.popitem(last=False)
 
             if text:
                 sys.stderr.write(f"{CLR}{GREEN}[ OK ]{RESET} {text}\n")
@@ -226,7 +390,8 @@ def run(args):
         sys.stderr.write(f"\n{CYAN}Bye!{RESET}\n")
     finally:
         termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-        recorder.stop()
+        recorder.close()
+        sel.close()
 
 
 def main():
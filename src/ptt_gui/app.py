@@ -16,8 +16,10 @@ import os
 import sys
 import threading
 import time
-from datetime import datetime
-from typing import Optional
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TYPE_CHECKING
 
 import gi
 
@@ -26,7 +28,10 @@ gi.require_version("Adw", "1")
 gi.require_version("GdkPixbuf", "2.0")
 from gi.repository import Adw, GLib, Gtk, Gdk, GdkPixbuf, Gio  # noqa: E402
 
-import numpy as np  # noqa: E402
+# numpy appears only in type hints here; all runtime array work happens
+# in ptt_gui.core, so keep it out of this module's import graph.
+if TYPE_CHECKING:
+    import numpy as np
 
 # Local core (same package)
 from ptt_gui.core import (  # noqa: E402
@@ -224,25 +229,6 @@ headerbar {
     padding: 8px;
 }
 
-.waveform-box {
-    min-height: 80px;
-}
-
-.wf-bar {
-    background-color: #89b4fa;
-    border-radius: 2px;
-    min-width: 4px;
-    transition: all 80ms ease;
-}
-
-.wf-bar-idle {
-    background-color: #45475a;
-}
-
-.wf-bar-high {
-    background-color: #a6e3a1;
-}
-
 /* Mini mode */
 .mini-window {
     background-color: #1e1e2e;
@@ -295,59 +281,98 @@ headerbar {
 # Waveform drawing area
 # ---------------------------------------------------------------------------
 
-class WaveformWidget(Gtk.Box):
-    """CSS-based bar-graph waveform (no cairo dependency).
+class WaveformWidget(Gtk.DrawingArea):
+    """Cairo bar-graph waveform rendered by a single draw func.
     Feed RMS values via push_level()."""
 
+    BAR_WIDTH = 4
+    BAR_SPACING = 2
+
     def __init__(self) -> None:
-        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=2)
-        self.add_css_class("waveform-box")
+        super().__init__()
+        self.set_content_width(WAVEFORM_BARS * (self.BAR_WIDTH + self.BAR_SPACING))
+        self.set_content_height(80)
         self.set_halign(Gtk.Align.CENTER)
         self.set_valign(Gtk.Align.CENTER)
-        self.set_size_request(-1, 80)
 
-        self._levels: list[float] = [0.0] * WAVEFORM_BARS
-        self._bars: list[Gtk.Box] = []
+        # SPSC ring between the realtime audio thread (writer) and the GTK
+        # draw func (reader). The writer only stores a slot and bumps
+        # _write_idx — both GIL-atomic — so neither side takes a lock and
+        # push_level never allocates.
+        self._levels = array("f", [0.0] * WAVEFORM_BARS)
+        self._write_idx: int = 0
         self._active: bool = False
+        self._tick_id: int = 0
+
+        # Colours parsed once; the draw func fills rectangles directly
+        # instead of toggling CSS classes on 40 child widgets.
+        self._color_bar = Gdk.RGBA()
+        self._color_bar.parse("#89b4fa")
+        self._color_high = Gdk.RGBA()
+        self._color_high.parse("#a6e3a1")
+        self._color_idle = Gdk.RGBA()
+        self._color_idle.parse("#45475a")
 
-        for _ in range(WAVEFORM_BARS):
-            bar = Gtk.Box()
-            bar.add_css_class("wf-bar")
-            bar.set_size_request(4, 3)
-            bar.set_valign(Gtk.Align.CENTER)
-            self.append(bar)
-            self._bars.append(bar)
+        self.set_draw_func(self._draw)
 
     def push_level(self, rms: float) -> None:
-        self._levels.append(min(rms * 3.5, 1.0))
-        if len(self._levels) > WAVEFORM_BARS:
-            self._levels.pop(0)
-        GLib.idle_add(self._update_bars)
+        self._levels[self._write_idx % WAVEFORM_BARS] = min(rms * 3.5, 1.0)
+        self._write_idx += 1
 
     def set_active(self, active: bool) -> None:
         self._active = active
-        if not active:
-            self._levels = [0.0] * WAVEFORM_BARS
-        GLib.idle_add(self._update_bars)
-
-    def _update_bars(self) -> None:
-        if self._active:
-            for i, bar in enumerate(self._bars):
-                lvl = self._levels[i] if i < len(self._levels) else 0.0
-                h = max(3, int(lvl * 72))
-                bar.set_size_request(4, h)
-                bar.remove_css_class("wf-bar-idle")
-                if lvl > 0.6:
-                    bar.add_css_class("wf-bar-high")
-                else:
-                    bar.remove_css_class("wf-bar-high")
+        if active:
+            if self._tick_id == 0:
+                # Frame-clock driven: redraw at most once per vsync frame
+                # instead of once per audio chunk.
+                self._tick_id = self.add_tick_callback(self._on_tick)
         else:
-            # Static idle state — flat bars, no animation
-            for bar in self._bars:
-                bar.set_size_request(4, 3)
-                bar.add_css_class("wf-bar-idle")
-                bar.remove_css_class("wf-bar-high")
-        return GLib.SOURCE_REMOVE
+            self._levels = array("f", [0.0] * WAVEFORM_BARS)
+            self.queue_draw()
+
+    def _on_tick(self, _widget, _frame_clock) -> bool:
+        if not self._active:
+            self._tick_id = 0
+            return GLib.SOURCE_REMOVE
+        self.queue_draw()
+        return GLib.SOURCE_CONTINUE
+
+    def _draw(self, _area, cr, width: int, height: int) -> None:
+        # Snapshot the writer index once; a concurrently written slot only
+        # costs one stale bar for one frame.
+        head = self._write_idx % WAVEFORM_BARS
+        # Oldest → newest, left → right
+        levels = self._levels[head:] + self._levels[:head]
+        step = width / WAVEFORM_BARS
+        bar_w = max(step - self.BAR_SPACING, 1.0)
+        mid = height / 2
+        # Bucket rectangles by colour so cairo gets one set_source + fill
+        # per colour instead of one state change per bar.  Fixed lists,
+        # not a dict: Gdk.RGBA defines __eq__ without __hash__ and is
+        # therefore unhashable.
+        high_bars: list[tuple[float, float]] = []
+        low_bars: list[tuple[float, float]] = []
+        idle_bars: list[tuple[float, float]] = []
+        for i in range(WAVEFORM_BARS):
+            lvl = float(levels[i])
+            if self._active and lvl > 0.0:
+                bucket = high_bars if lvl > 0.6 else low_bars
+                h = max(3.0, lvl * (height - 8))
+            else:
+                bucket = idle_bars
+                h = 3.0
+            bucket.append((i * step, h))
+        for color, bars in (
+            (self._color_high, high_bars),
+            (self._color_bar, low_bars),
+            (self._color_idle, idle_bars),
+        ):
+            if not bars:
+                continue
+            cr.set_source_rgba(color.red, color.green, color.blue, color.alpha)
+            for x, h in bars:
+                cr.rectangle(x, mid - h / 2, bar_w, h)
+            cr.fill()
 
 
 # ---------------------------------------------------------------------------
@@ -502,20 +527,26 @@ class SettingsDialog(Adw.Dialog):
 
         # --- Microphone sensitivity ---
         sens_group = Adw.PreferencesGroup(title="Mikrofon")
-        sens_row = Adw.SpinRow.new_with_range(0.5, 5.0, 0.1)
-        sens_row.set_title("Wzmocnienie sygnału (gain)")
-        sens_row.set_value(parent.gain)
-        sens_row.connect("changed", lambda r: setattr(parent, "gain", r.get_value()))
-        sens_group.add(sens_row)
+        # Values are read back in _commit_settings — a "changed" handler
+        # would fire on every keystroke and scroll tick while editing.
+        self._sens_row = Adw.SpinRow.new_with_range(0.5, 5.0, 0.1)
+        self._sens_row.set_title("Wzmocnienie sygnału (gain)")
+        self._sens_row.set_value(parent.gain)
+        sens_group.add(self._sens_row)
+
+        self._silence_row = Adw.SpinRow.new_with_range(0.0, 0.05, 0.001)
+        self._silence_row.set_digits(3)
+        self._silence_row.set_title("Próg ciszy (RMS)")
+        self._silence_row.set_value(parent.silence_threshold)
+        sens_group.add(self._silence_row)
         content.append(sens_group)
 
         # --- Min duration ---
         dur_group = Adw.PreferencesGroup(title="Transkrypcja")
-        dur_row = Adw.SpinRow.new_with_range(0.1, 2.0, 0.1)
-        dur_row.set_title("Min. czas nagrania (s)")
-        dur_row.set_value(parent.min_duration)
-        dur_row.connect("changed", lambda r: setattr(parent, "min_duration", r.get_value()))
-        dur_group.add(dur_row)
+        self._dur_row = Adw.SpinRow.new_with_range(0.1, 2.0, 0.1)
+        self._dur_row.set_title("Min. czas nagrania (s)")
+        self._dur_row.set_value(parent.min_duration)
+        dur_group.add(self._dur_row)
         content.append(dur_group)
 
         # Apply button
@@ -530,10 +561,19 @@ class SettingsDialog(Adw.Dialog):
         toolbar_view.set_content(scrolled)
         self.set_child(toolbar_view)
 
+        # Spin-row values are committed once, whichever way the dialog ends
+        self.connect("closed", lambda _d: self._commit_settings())
+
     def _on_mode_changed(self, row, _param) -> None:
         self._parent.auto_type = (row.get_selected() == 1)
 
+    def _commit_settings(self) -> None:
+        self._parent.gain = self._sens_row.get_value()
+        self._parent.min_duration = self._dur_row.get_value()
+        self._parent.silence_threshold = self._silence_row.get_value()
+
     def _on_apply(self, _btn) -> None:
+        self._commit_settings()
         pending = getattr(self._parent, "_pending_whisper_model", None)
         if pending:
             self._parent.whisper_model = pending
@@ -573,21 +613,30 @@ class PTTWindow(Adw.ApplicationWindow):
         self.auto_type: bool = True
         self.gain: float = 1.0
         self.min_duration: float = 0.3
+        # Normalized RMS below which a recording is treated as silence
+        # and never handed to the model (tune in settings)
+        self.silence_threshold: float = 0.005
         self._model: Optional[object] = None
         self._model_loading: bool = False
         self._recorder = Recorder(on_chunk=self._on_audio_chunk)
         self._recording: bool = False
-        self._history_items: list[str] = []
+        # Newest-first widget refs; maxlen gives O(1) trimming in
+        # _add_to_history without walking the sibling chain.
+        self._history_rows: deque["HistoryRow"] = deque(maxlen=HISTORY_MAX)
         self._append_target: Optional["HistoryRow"] = None  # row to append to
-
-        # --- CSS ---
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_string(DARK_CSS)
-        Gtk.StyleContext.add_provider_for_display(
-            Gdk.Display.get_default(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-        )
+        # Currently applied status-label CSS class (see _set_status)
+        self._status_style: str = ""
+        # Audio-thread → waveform throttle state (see _on_audio_chunk)
+        self._pending_rms: float = 0.0
+        self._last_push_ns: int = 0
+        # Resolved once — every transcription and copy reuses this object
+        self._clipboard = Gdk.Display.get_default().get_clipboard()
+        # Persistent workers: one serializes wtype/clipboard I/O (rapid
+        # "Type" clicks must not interleave keystrokes), one opens the
+        # PortAudio stream off the GTK loop.
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ptt-io")
+        self._rec_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ptt-rec")
+        self.connect("close-request", self._on_close_request)
 
         # --- Build UI ---
         self._build_ui()
@@ -598,10 +647,19 @@ class PTTWindow(Adw.ApplicationWindow):
         # No idle animation — waveform only updates when recording
 
         # --- Keyboard shortcut: Space = push-to-talk ---
-        key_ctrl = Gtk.EventControllerKey()
-        key_ctrl.connect("key-pressed", self._on_key_pressed)
-        key_ctrl.connect("key-released", self._on_key_released)
-        self.add_controller(key_ctrl)
+        # Declarative shortcut: GTK matches the trigger in C and only
+        # enters Python for Space, not for every keystroke in the window.
+        toggle_action = Gio.SimpleAction.new("ptt-toggle", None)
+        toggle_action.connect("activate", self._on_ptt_toggle_action)
+        self.add_action(toggle_action)
+
+        shortcuts = Gtk.ShortcutController()
+        shortcuts.set_scope(Gtk.ShortcutScope.LOCAL)
+        shortcuts.add_shortcut(Gtk.Shortcut.new(
+            Gtk.ShortcutTrigger.parse_string("space"),
+            Gtk.NamedAction.new("win.ptt-toggle"),
+        ))
+        self.add_controller(shortcuts)
 
     # ======================================================================
     # UI construction
@@ -653,7 +711,11 @@ class PTTWindow(Adw.ApplicationWindow):
         main_box.append(right)
 
         toolbar_view.set_content(main_box)
-        self.set_content(toolbar_view)
+
+        # Toast overlay is the window root — built once, no reparenting
+        self._toast_overlay = Adw.ToastOverlay()
+        self._toast_overlay.set_child(toolbar_view)
+        self.set_content(self._toast_overlay)
 
     def _build_left_panel(self) -> Gtk.Widget:
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=24)
@@ -793,7 +855,16 @@ class PTTWindow(Adw.ApplicationWindow):
 
     def _load_model_worker(self) -> None:
         try:
-            model = load_model(self.whisper_model)
+            app = self.get_application()
+            cache = getattr(app, "model_cache", None)
+            if cache is not None:
+                with app.model_cache_lock:
+                    model = cache.get(self.whisper_model)
+                    if model is None:
+                        model = load_model(self.whisper_model)
+                        cache[self.whisper_model] = model
+            else:
+                model = load_model(self.whisper_model)
             GLib.idle_add(self._on_model_loaded, model)
         except Exception as exc:
             GLib.idle_add(self._on_model_error, str(exc))
@@ -831,8 +902,8 @@ class PTTWindow(Adw.ApplicationWindow):
         self._mic_btn.add_css_class("recording")
         self._set_status("NAGRYWANIE...", "recording")
         self._mic_label.set_label("STOP")
-        # Open the PortAudio stream in a thread to avoid blocking the GTK loop
-        threading.Thread(target=self._recorder.start, daemon=True).start()
+        # Open the PortAudio stream off the GTK loop
+        self._rec_pool.submit(self._recorder.start)
 
     def _stop_recording(self) -> None:
         if not self._recording:
@@ -843,19 +914,20 @@ class PTTWindow(Adw.ApplicationWindow):
         self._mic_btn.remove_css_class("recording")
 
         duration = len(audio) / 16000
-        rms_val = float(np.sqrt(np.mean(audio.astype(np.float32) ** 2))) if len(audio) > 0 else 0
-        print(f"[DBG] _stop_recording: duration={duration:.2f}s, rms={rms_val:.1f}")
+        rms_val = rms_level(audio)
+        print(f"[DBG] _stop_recording: duration={duration:.2f}s, rms={rms_val:.4f}")
 
         if duration < self.min_duration:
             self._reset_to_ready()
             self._show_toast(f"Za krótkie ({duration:.1f}s)")
             return
 
-        # Skip silence — if RMS < 100, there's no speech
-        if rms_val < 100:
+        # Skip silence — a full whisper pass on an accidental tap costs
+        # seconds of wall clock for nothing
+        if rms_val < self.silence_threshold:
             self._reset_to_ready()
             self._show_toast("Cisza — nie wykryto mowy")
-            print(f"[DBG] Skipped: silence (rms={rms_val:.1f})")
+            print(f"[DBG] Skipped: silence (rms={rms_val:.4f})")
             return
 
         self._set_status("PRZETWARZANIE...", "transcribing")
@@ -899,27 +971,27 @@ class PTTWindow(Adw.ApplicationWindow):
             row.append_text(text)
             row._btn_rec.remove_css_class("active")
             full_text = row.get_text()
-            clipboard = Gdk.Display.get_default().get_clipboard()
-            clipboard.set(full_text)
+            self._clipboard.set(full_text)
             self._show_toast("Dopisano do wpisu")
         else:
             # Normal mode: create new history entry
             self._add_to_history(text)
-            clipboard = Gdk.Display.get_default().get_clipboard()
-            clipboard.set(text)
+            self._clipboard.set(text)
             if self.auto_type:
-                threading.Thread(
-                    target=self._wtype_with_delay, args=(text,), daemon=True
-                ).start()
+                # Brief delay so the PTT window loses focus first; the main
+                # loop owns the timer instead of a worker sleeping on it.
+                GLib.timeout_add(250, self._wtype_after_delay, text)
             else:
                 self._show_toast("Skopiowano do schowka")
 
         return GLib.SOURCE_REMOVE
 
-    def _wtype_with_delay(self, text: str) -> None:
-        """Wait briefly so the PTT window loses focus, then type via wtype."""
-        time.sleep(0.25)
-        print(f"[DBG] _wtype_with_delay: calling wtype with '{text}'")
+    def _wtype_after_delay(self, text: str) -> bool:
+        self._io_pool.submit(self._wtype_worker, text)
+        return GLib.SOURCE_REMOVE
+
+    def _wtype_worker(self, text: str) -> None:
+        print(f"[DBG] _wtype_worker: calling wtype with '{text}'")
         ok = wtype_text(text)
         print(f"[DBG] wtype result: {ok}")
         if not ok:
@@ -938,13 +1010,26 @@ class PTTWindow(Adw.ApplicationWindow):
         self._set_status("GOTOWY", "ready")
         self._mic_label.set_label("START")
 
+    def _on_close_request(self, _win) -> bool:
+        self._io_pool.shutdown(wait=False)
+        self._rec_pool.shutdown(wait=False)
+        return False  # allow the window to close
+
     # ======================================================================
     # Audio chunk callback (audio thread)
     # ======================================================================
 
     def _on_audio_chunk(self, chunk: "np.ndarray") -> None:
+        # Coalesce: PortAudio delivers blocks far faster than the waveform
+        # refreshes, so keep the loudest pending level and hand it over at
+        # most once per WAVEFORM_UPDATE_MS.
         level = rms_level(chunk) * self.gain
-        self._waveform.push_level(level)
+        self._pending_rms = max(self._pending_rms, level)
+        now = time.monotonic_ns()
+        if now - self._last_push_ns >= WAVEFORM_UPDATE_MS * 1_000_000:
+            self._waveform.push_level(self._pending_rms)
+            self._pending_rms = 0.0
+            self._last_push_ns = now
 
     # ======================================================================
     # History management
@@ -955,40 +1040,29 @@ class PTTWindow(Adw.ApplicationWindow):
         if self._empty_label.get_parent() is not None:
             self._history_box.remove(self._empty_label)
 
-        ts = datetime.now().strftime("%H:%M:%S")
+        ts = time.strftime("%H:%M:%S")
         row = HistoryRow(text, ts, self._copy_text, self._type_text, self._rec_more)
+
+        # Trim the oldest row before the deque drops its reference
+        if len(self._history_rows) == HISTORY_MAX:
+            self._history_box.remove(self._history_rows[-1])
         self._history_box.prepend(row)
-        self._history_items.insert(0, text)
+        self._history_rows.appendleft(row)
         return row
 
-        # Trim excess
-        children = []
-        child = self._history_box.get_first_child()
-        while child:
-            children.append(child)
-            child = child.get_next_sibling()
-
-        while len(children) > HISTORY_MAX:
-            self._history_box.remove(children[-1])
-            children.pop()
-
     def _on_clear_history(self, _btn) -> None:
-        self._history_items.clear()
-        child = self._history_box.get_first_child()
-        while child:
-            nxt = child.get_next_sibling()
-            self._history_box.remove(child)
-            child = nxt
+        for row in self._history_rows:
+            self._history_box.remove(row)
+        self._history_rows.clear()
         self._history_box.append(self._empty_label)
 
     def _copy_text(self, text: str) -> None:
         # GTK clipboard (Wayland-native)
-        clipboard = Gdk.Display.get_default().get_clipboard()
-        clipboard.set(text)
+        self._clipboard.set(text)
         self._show_toast("Skopiowano do schowka")
 
     def _type_text(self, text: str) -> None:
-        threading.Thread(target=self._type_worker, args=(text,), daemon=True).start()
+        self._io_pool.submit(self._type_worker, text)
 
     def _type_worker(self, text: str) -> None:
         ok = wtype_text(text)
@@ -1009,25 +1083,25 @@ class PTTWindow(Adw.ApplicationWindow):
     # ======================================================================
 
     def _set_status(self, label: str, style: str) -> None:
+        # Touch the label/classes only when they actually change — each
+        # setter is a GObject notify plus a CSS invalidation.
+        if label == self._status_label.get_text() and style == self._status_style:
+            return
         self._status_label.set_label(label)
-        for cls in ("ready", "recording", "transcribing"):
-            self._status_label.remove_css_class(cls)
-        if style:
-            self._status_label.add_css_class(style)
+        if style != self._status_style:
+            if self._status_style:
+                self._status_label.remove_css_class(self._status_style)
+            if style:
+                self._status_label.add_css_class(style)
+            self._status_style = style
 
     def _show_toast(self, message: str) -> None:
         """Show an Adwaita toast notification."""
         toast = Adw.Toast(title=message)
         toast.set_timeout(3)
-        # Find the ToastOverlay — we wrap the content in one
-        overlay = self._get_toast_overlay()
-        if overlay:
-            overlay.add_toast(toast)
+        self._toast_overlay.add_toast(toast)
         return GLib.SOURCE_REMOVE
 
-    def _get_toast_overlay(self) -> Optional[Adw.ToastOverlay]:
-        return getattr(self, "_toast_overlay", None)
-
     # ======================================================================
     # Event handlers
     # ======================================================================
@@ -1044,17 +1118,11 @@ class PTTWindow(Adw.ApplicationWindow):
         else:
             self._start_recording()
 
-    def _on_key_pressed(self, ctrl, keyval, keycode, state) -> bool:
-        if keyval == Gdk.KEY_space:
-            if self._recording:
-                self._stop_recording()
-            else:
-                self._start_recording()
-            return True
-        return False
-
-    def _on_key_released(self, ctrl, keyval, keycode, state) -> None:
-        pass  # toggle mode — all handled in key-pressed
+    def _on_ptt_toggle_action(self, _action, _param) -> None:
+        if self._recording:
+            self._stop_recording()
+        else:
+            self._start_recording()
 
     def _on_auto_type_toggle(self, switch, state) -> bool:
         self.auto_type = state
@@ -1188,22 +1256,6 @@ class MiniWindow(Gtk.Window):
         return False
 
 
-# ---------------------------------------------------------------------------
-# Wrap window in ToastOverlay (must be done before show)
-# ---------------------------------------------------------------------------
-
-class PTTWindowWithToast(PTTWindow):
-    def __init__(self, app: Adw.Application) -> None:
-        super().__init__(app)
-        # Re-wrap the content in a ToastOverlay
-        content = self.get_content()
-        self.set_content(None)
-        overlay = Adw.ToastOverlay()
-        overlay.set_child(content)
-        self.set_content(overlay)
-        self._toast_overlay = overlay
-
-
 # ---------------------------------------------------------------------------
 # Application entry point
 # ---------------------------------------------------------------------------
@@ -1214,11 +1266,17 @@ class PTTApplication(Adw.Application):
             application_id=APP_ID,
             flags=Gio.ApplicationFlags.DEFAULT_FLAGS,
         )
-        self._window: Optional[PTTWindowWithToast] = None
+        self._window: Optional[PTTWindow] = None
+        # Loaded models keyed by size; windows and reload_model() reuse
+        # entries instead of re-reading the checkpoint from disk.
+        self.model_cache: dict[str, object] = {}
+        # Serializes the preload thread and window loaders so the same
+        # checkpoint is never loaded twice concurrently.
+        self.model_cache_lock = threading.Lock()
 
     def do_activate(self) -> None:
         if self._window is None:
-            self._window = PTTWindowWithToast(self)
+            self._window = PTTWindow(self)
             # Force dark colour scheme
             Adw.StyleManager.get_default().set_color_scheme(Adw.ColorScheme.FORCE_DARK)
         self._window.present()
@@ -1226,12 +1284,35 @@ class PTTApplication(Adw.Application):
     def do_startup(self) -> None:
         Adw.Application.do_startup(self)
 
+        # Parse the stylesheet once per process, not once per window.
+        # load_from_string() re-tokenises the whole sheet, so registering
+        # the provider here keeps window construction off that path.
+        css_provider = Gtk.CssProvider()
+        css_provider.load_from_string(DARK_CSS)
+        Gtk.StyleContext.add_provider_for_display(
+            Gdk.Display.get_default(),
+            css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+        )
+
         # Quit action
         quit_action = Gio.SimpleAction.new("quit", None)
         quit_action.connect("activate", lambda *_: self.quit())
         self.add_action(quit_action)
         self.set_accels_for_action("app.quit", ["<Ctrl>q"])
 
+        # Start loading the default model now so the heavy disk/mmap work
+        # overlaps with window construction instead of following it.
+        threading.Thread(target=self._preload_model, daemon=True).start()
+
+    def _preload_model(self) -> None:
+        try:
+            with self.model_cache_lock:
+                if DEFAULT_WHISPER_MODEL not in self.model_cache:
+                    self.model_cache[DEFAULT_WHISPER_MODEL] = load_model(DEFAULT_WHISPER_MODEL)
+        except Exception:
+            pass  # the window's own loader will surface the error
+
 
 def main(argv: Optional[list[str]] = None) -> int:
     app = PTTApplication()
@@ -9,23 +9,33 @@ Model: whisper base, language: Polish (pl).
 
 from __future__ import annotations
 
-import io
+import hashlib
+import math
 import os
+import shutil
 import subprocess
-import tempfile
 import threading
-import wave
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable, Optional
 
 import numpy as np
 import sounddevice as sd
 from faster_whisper import WhisperModel
 
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:  # older faster-whisper
+    BatchedInferencePipeline = None
+
 SAMPLE_RATE: int = 16000
 CHANNELS: int = 1
 BLOCK_SIZE: int = 1024
 
-# Default whisper model size — "base" is a good speed/quality balance for CPU
+# Default whisper model size — "base" is a good speed/quality balance for CPU.
+# Set PTT_WHISPER_MODEL to try an alternative checkpoint, e.g. a distil-whisper
+# CTranslate2 conversion ("distil-large-v3"), without touching callers.
 DEFAULT_WHISPER_MODEL: str = "base"
 # Language hint for Whisper — speeds up recognition and improves accuracy
 DEFAULT_LANGUAGE: str = "pl"
@@ -35,9 +45,66 @@ DEFAULT_LANGUAGE: str = "pl"
 # Model loading
 # ---------------------------------------------------------------------------
 
+# Loaded models keyed by (model_size, device, compute_type) — re-running
+# CTranslate2 init for a checkpoint that is already in memory costs 1-2 s.
+_MODEL_CACHE: dict[tuple[str, str, str], WhisperModel] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _warmup(model: WhisperModel) -> None:
+    """Prime the model with one second of silence.
+
+    The first transcribe call pays one-off kernel/cache setup; doing it
+    here keeps that cost out of the first real utterance.  Best-effort.
+    """
+    try:
+        segments, _info = model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32),
+            language=getattr(model, "language", DEFAULT_LANGUAGE),
+            beam_size=1,
+        )
+        for _ in segments:
+            pass
+    except Exception:
+        pass
+
+
+def _cpu_threads() -> int:
+    """Thread count for CTranslate2: PTT_CPU_THREADS override, else the
+    cores this process may actually run on."""
+    env = os.environ.get("PTT_CPU_THREADS")
+    if env:
+        try:
+            return max(1, int(env))
+        except ValueError:
+            pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # non-Linux
+        return os.cpu_count() or 4
+
+
+def _pick_compute_type(device: str) -> str:
+    """Return the fastest quantization ctranslate2 supports on *device*."""
+    try:
+        import ctranslate2
+        supported = set(ctranslate2.get_supported_compute_types(device))
+    except Exception:
+        supported = set()
+    preferences = (
+        ("int8_float16", "float16", "int8") if device == "cuda" else ("int8",)
+    )
+    for candidate in preferences:
+        if candidate in supported:
+            return candidate
+    return "int8" if device == "cpu" else "default"
+
+
 def load_model(
     model_size: str = DEFAULT_WHISPER_MODEL,
     language: str = DEFAULT_LANGUAGE,
+    device: str = "auto",
+    compute_type: str = "auto",
 ) -> WhisperModel:
     """Load a faster-whisper model.
 
@@ -50,30 +117,175 @@ def load_model(
         Whisper model size: "tiny", "base", "small", "medium", "large-v3", …
     language:
         Language hint stored on the model object for use in transcribe().
+    device:
+        "cpu", "cuda", or "auto" to use CUDA when an NVIDIA driver is present.
+    compute_type:
+        A ctranslate2 compute type, or "auto" to probe the fastest one the
+        device actually supports (int8 on CPU, int8_float16 on CUDA).
 
     Returns
     -------
     WhisperModel
         A loaded faster-whisper model instance with a `language` attribute set.
     """
-    model = WhisperModel(
-        model_size,
-        device="cpu",
-        compute_type="int8",  # fastest CPU inference
-    )
-    # Attach language preference so callers don't need to pass it separately
-    model.language = language  # type: ignore[attr-defined]
+    # Env override for the stock default, e.g. a distil-whisper checkpoint;
+    # an explicitly requested size always wins.
+    if model_size == DEFAULT_WHISPER_MODEL:
+        model_size = os.environ.get("PTT_WHISPER_MODEL", model_size)
+    if device == "auto":
+        device = "cuda" if shutil.which("nvidia-smi") else "cpu"
+    if compute_type == "auto":
+        compute_type = _pick_compute_type(device)
+
+    key = (model_size, device, compute_type)
+    with _MODEL_CACHE_LOCK:
+        cached = _MODEL_CACHE.get(key)
+        if cached is not None:
+            cached.language = language  # type: ignore[attr-defined]
+            return cached
+        try:
+            model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=compute_type,
+                # transcribe() is matmul-bound; give CTranslate2 every usable
+                # core for the single in-flight request
+                cpu_threads=_cpu_threads(),
+                num_workers=1,
+            )
+        except (ValueError, RuntimeError):
+            # nvidia-smi ships with the bare driver package, so the CUDA
+            # probe passes on machines missing cuDNN/cuBLAS and the load
+            # fails here; retry on CPU/int8 (as the CLI does) instead of
+            # taking the GUI down at startup.
+            if device == "cpu":
+                raise
+            device, compute_type = "cpu", "int8"
+            key = (model_size, device, compute_type)
+            cached = _MODEL_CACHE.get(key)
+            if cached is not None:
+                cached.language = language  # type: ignore[attr-defined]
+                return cached
+            model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=_cpu_threads(),
+                num_workers=1,
+            )
+        # Attach language preference so callers don't need to pass it
+        model.language = language  # type: ignore[attr-defined]
+        _MODEL_CACHE[key] = model
+    _warmup(model)
     return model
 
 
+# One in-flight preload at a time; the future is shared so every caller
+# waits on the same load instead of racing duplicate ones.
+_PRELOAD_FUTURE: "Optional[Future[WhisperModel]]" = None
+_PRELOAD_LOCK = threading.Lock()
+
+
+def preload_model_async(
+    model_size: str = DEFAULT_WHISPER_MODEL,
+    language: str = DEFAULT_LANGUAGE,
+) -> "Future[WhisperModel]":
+    """Start loading the model in the background and return a Future.
+
+    Meant for app startup: kick this off at GUI boot so the first PTT
+    press doesn't pay the multi-second model load.  Repeated calls share
+    one future (and load_model()'s own cache makes later sizes cheap to
+    request directly).
+    """
+    global _PRELOAD_FUTURE
+    with _PRELOAD_LOCK:
+        if _PRELOAD_FUTURE is None:
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ptt-preload"
+            )
+            _PRELOAD_FUTURE = executor.submit(load_model, model_size, language)
+            # One-shot executor: tear its thread down after the load
+            executor.shutdown(wait=False)
+        return _PRELOAD_FUTURE
+
+
 # ---------------------------------------------------------------------------
 # Transcription
 # ---------------------------------------------------------------------------
 
-def transcribe(model: WhisperModel, audio_data: np.ndarray) -> str:
+# Below this length a clip yields one VAD segment and batching cannot help
+_BATCH_MIN_SECONDS = 30
+
+# Audio-fingerprint → transcript memoization for identical re-captures
+# (accidental double taps).  Opt-in via PTT_RESULT_CACHE=1 so tests with
+# mocked models stay deterministic.
+_RESULT_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_RESULT_CACHE_SIZE = 32
+
+
+def _result_cache_enabled() -> bool:
+    return os.environ.get("PTT_RESULT_CACHE", "0") not in ("", "0")
+
+
+def _cache_result(key: Optional[bytes], text: str) -> str:
+    """Store *text* under *key* (LRU, bounded) and return it."""
+    if key is not None:
+        _RESULT_CACHE[key] = text
+        if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return text
+
+# Reusable float32 scratch buffers for the int16→float32 normalization,
+# so repeated dictations don't allocate a fresh recording-sized array
+# each time.  Tiny LIFO guarded by a lock; concurrent transcriptions
+# simply fall through to a fresh allocation.
+_F32_POOL: list[np.ndarray] = []
+_F32_POOL_MAX = 2
+_F32_POOL_LOCK = threading.Lock()
+
+
+def _f32_acquire(n: int) -> np.ndarray:
+    """Return a float32 buffer of capacity >= *n* (pooled when possible)."""
+    with _F32_POOL_LOCK:
+        for i, buf in enumerate(_F32_POOL):
+            if buf.size >= n:
+                return _F32_POOL.pop(i)
+    return np.empty(max(n, SAMPLE_RATE), dtype=np.float32)
+
+
+def _f32_release(buf: np.ndarray) -> None:
+    with _F32_POOL_LOCK:
+        if len(_F32_POOL) < _F32_POOL_MAX:
+            _F32_POOL.append(buf)
+
+
+# One pipeline per model, created lazily and dropped with the model
+_PIPELINES: "weakref.WeakKeyDictionary[WhisperModel, object]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _batched_pipeline(model: WhisperModel):
+    """Return (and cache) a BatchedInferencePipeline for *model*, or None."""
+    if BatchedInferencePipeline is None:
+        return None
+    pipeline = _PIPELINES.get(model)
+    if pipeline is None:
+        pipeline = BatchedInferencePipeline(model=model)
+        _PIPELINES[model] = pipeline
+    return pipeline
+
+
+def transcribe(
+    model: WhisperModel,
+    audio_data: np.ndarray,
+    min_rms: float = 0.0,
+    vad_threshold: float = 0.5,
+) -> str:
     """Transcribe *audio_data* (int16, mono, 16 kHz) using Whisper.
 
-    Writes audio to a temporary WAV file, then feeds it to faster-whisper.
+    Hands faster-whisper the normalized float32 waveform directly — no
+    temp WAV encode/decode round-trip on the way to the model.
     Returns the recognised text, or an empty string if nothing was heard.
 
     Parameters
@@ -82,51 +294,145 @@ def transcribe(model: WhisperModel, audio_data: np.ndarray) -> str:
         A WhisperModel loaded via load_model().  Should have a .language attr.
     audio_data:
         Flat int16 numpy array, mono, sampled at SAMPLE_RATE.
+    min_rms:
+        Normalized RMS below which the clip is treated as silence and
+        returned as "" without invoking the model.  0.0 disables the gate
+        (callers that already gate, like the GUI, keep it off).
+    vad_threshold:
+        Silero VAD speech-probability threshold passed to faster-whisper.
 
     Returns
     -------
     str
         Transcribed text, stripped of leading/trailing whitespace.
     """
-    if len(audio_data) == 0:
+    # .size is shape-agnostic (len() raises on 0-d arrays); normalizing to
+    # contiguous int16 up front lets every downstream kernel assume
+    # int16[::1] with no defensive dispatch.  Both are no-ops for the
+    # arrays Recorder produces.
+    if audio_data.size == 0:
+        return ""
+    audio_data = np.ascontiguousarray(audio_data, dtype=np.int16)
+    if min_rms > 0.0 and rms_level(audio_data) < min_rms:
         return ""
 
+    cache_key = None
+    if _result_cache_enabled():
+        cache_key = hashlib.blake2b(audio_data.tobytes(), digest_size=16).digest()
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            _RESULT_CACHE.move_to_end(cache_key)
+            return cached
+
     language = getattr(model, "language", DEFAULT_LANGUAGE)
 
-    # Write audio to a temp WAV file — faster-whisper reads from file path
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp_path = tmp.name
-        with wave.open(tmp, "wb") as wf:
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(2)          # int16 = 2 bytes per sample
-            wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(audio_data.tobytes())
+    # Cast and scale in one pass into a pooled scratch buffer —
+    # dtype=float32 folds the int16→float conversion into the multiply,
+    # and out= reuses memory across dictations.
+    scratch = _f32_acquire(audio_data.size)
+    audio_f32 = scratch[: audio_data.size]
+    np.multiply(audio_data, np.float32(1.0 / 32768.0), out=audio_f32, dtype=np.float32)
+
+    # The Silero VAD pass has a fixed cost that dominates on short PTT
+    # captures, where the user already gated speech with the button.
+    use_vad = len(audio_data) > 2 * SAMPLE_RATE
 
     try:
+        # Long recordings split into many VAD segments; the batched pipeline
+        # runs their encoder passes as one fused forward.
+        if len(audio_data) >= _BATCH_MIN_SECONDS * SAMPLE_RATE:
+            pipeline = _batched_pipeline(model)
+            if pipeline is not None:
+                try:
+                    segments, _info = pipeline.transcribe(
+                        audio_f32,
+                        batch_size=8,
+                        language=language,
+                        beam_size=1,
+                        vad_filter=True,
+                    )
+                    text = " ".join(seg.text for seg in segments).strip()
+                    return _cache_result(cache_key, text)
+                except Exception:
+                    pass  # fall back to the unbatched path
+
         segments, _info = model.transcribe(
-            tmp_path,
+            audio_f32,
             language=language,
-            beam_size=1,            # fastest decoding
-            vad_filter=True,        # skip silent parts automatically
+            # Pure greedy decode: no hypothesis bookkeeping, no decoder state
+            # threaded across segments, and no temperature-fallback retries
+            # (each triggered retry silently doubles latency)
+            beam_size=1,
+            best_of=1,
+            temperature=[0.0],
+            condition_on_previous_text=False,
+            without_timestamps=True,
+            compression_ratio_threshold=None,
+            log_prob_threshold=None,
+            no_speech_threshold=None,
+            vad_filter=use_vad,     # skip silent parts of longer recordings
             vad_parameters={
+                "threshold": vad_threshold,
                 "min_silence_duration_ms": 300,
                 "speech_pad_ms": 200,
-            },
+            } if use_vad else None,
         )
-        text = " ".join(seg.text for seg in segments).strip()
+        return _cache_result(cache_key, " ".join(seg.text for seg in segments).strip())
     finally:
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
-
-    return text
+        # Segments were fully drained above, so the buffer is idle again
+        _f32_release(scratch)
 
 
 # ---------------------------------------------------------------------------
 # wtype integration
 # ---------------------------------------------------------------------------
 
+# Optional direct XTEST path — synthesizing Ctrl+V over a cached X
+# connection skips the ~10 ms xdotool fork/exec per paste.
+try:
+    from Xlib import X as _X
+    from Xlib import display as _xdisplay
+    from Xlib.ext import xtest as _xtest
+except ImportError:
+    _xdisplay = None
+
+_x_display = None
+
+# Which typing/clipboard tools exist, probed once — a missing tool costs a
+# full exec attempt per call otherwise.  If the probe finds nothing (PATH
+# may differ at runtime, e.g. under tests), fall back to probing by exec.
+_AVAILABLE_TOOLS = frozenset(
+    tool
+    for tool in ("xclip", "xdotool", "wtype", "wl-copy")
+    if shutil.which(tool)
+)
+
+
+def _tool_usable(name: str) -> bool:
+    return name in _AVAILABLE_TOOLS or not _AVAILABLE_TOOLS
+
+
+def _xtest_paste() -> bool:
+    """Synthesize Ctrl+V via XTEST.  Returns False if X is unavailable."""
+    global _x_display
+    if _xdisplay is None:
+        return False
+    try:
+        if _x_display is None:
+            _x_display = _xdisplay.Display()
+        ctrl = _x_display.keysym_to_keycode(0xFFE3)  # Control_L
+        v = _x_display.keysym_to_keycode(ord("v"))
+        _xtest.fake_input(_x_display, _X.KeyPress, ctrl)
+        _xtest.fake_input(_x_display, _X.KeyPress, v)
+        _xtest.fake_input(_x_display, _X.KeyRelease, v)
+        _xtest.fake_input(_x_display, _X.KeyRelease, ctrl)
+        _x_display.sync()
+        return True
+    except Exception:
+        _x_display = None  # stale connection — reconnect next time
+        return False
+
+
 def wtype_text(text: str) -> bool:
     """Type *text* into the previously active window.
 
@@ -134,26 +440,31 @@ def wtype_text(text: str) -> bool:
     Falls back to wtype if xdotool is unavailable.
     Returns True on success, False on failure.
     """
-    # Method 1: xclip + xdotool (works on GNOME Wayland with XWayland)
-    try:
-        subprocess.run(
-            ["xclip", "-selection", "clipboard"],
-            input=text.encode("utf-8"), check=True, timeout=3,
-        )
-        subprocess.run(
-            ["xdotool", "key", "--clearmodifiers", "ctrl+v"],
-            check=True, timeout=3,
-        )
-        return True
-    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-        pass
+    # Method 1: xclip + paste keystroke (works on GNOME Wayland with XWayland)
+    if _tool_usable("xclip"):
+        try:
+            subprocess.run(
+                ["xclip", "-selection", "clipboard"],
+                input=text.encode("utf-8"), check=True, timeout=3,
+            )
+            # Prefer direct XTEST over forking xdotool for the keystroke
+            if _xtest_paste():
+                return True
+            subprocess.run(
+                ["xdotool", "key", "--clearmodifiers", "ctrl+v"],
+                check=True, timeout=3,
+            )
+            return True
+        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            pass
 
     # Method 2: wtype (native Wayland — may not work on all compositors)
-    try:
-        subprocess.run(["wtype", "--", text], check=True, timeout=5)
-        return True
-    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-        pass
+    if _tool_usable("wtype"):
+        try:
+            subprocess.run(["wtype", "--", text], check=True, timeout=5)
+            return True
+        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            pass
 
     return False
 
@@ -161,6 +472,8 @@ def wtype_text(text: str) -> bool:
 def copy_to_clipboard_xdg(text: str) -> bool:
     """Copy *text* to clipboard via wl-copy (Wayland) or xclip (X11)."""
     for cmd in (["wl-copy"], ["xclip", "-selection", "clipboard"]):
+        if not _tool_usable(cmd[0]):
+            continue
         try:
             subprocess.run(cmd, input=text.encode(), check=True, timeout=3)
             return True
@@ -174,7 +487,12 @@ def copy_to_clipboard_xdg(text: str) -> bool:
 # ---------------------------------------------------------------------------
 
 class Recorder:
-    """Thread-safe audio recorder.
+    """Audio recorder with a single-writer buffer contract.
+
+    The PortAudio callback is the only writer to the arena; stop() only
+    reads it after ``stream.stop()`` returns, which PortAudio guarantees
+    quiesces the callback — so no lock is needed and the audio thread can
+    never block on one.
 
     Usage::
 
@@ -184,19 +502,52 @@ class Recorder:
         audio = recorder.stop()   # np.ndarray int16
     """
 
-    def __init__(self, on_chunk: Optional[Callable[[np.ndarray], None]] = None):
+    def __init__(
+        self,
+        on_chunk: Optional[Callable[[np.ndarray], None]] = None,
+        on_segment: Optional[Callable[[np.ndarray], None]] = None,
+        segment_silence_s: float = 0.6,
+        segment_min_rms: float = 0.005,
+    ):
         """
         Parameters
         ----------
         on_chunk:
             Optional callback invoked with each raw audio chunk (int16 array).
-            Called from the PortAudio thread — keep it lightweight.
+            Called from the PortAudio thread — keep it lightweight.  The
+            array is a view into the recording buffer; copy it if it must
+            be retained past the callback.
+        on_segment:
+            Optional callback invoked with a copied int16 array each time a
+            speech segment closes (a voiced stretch followed by
+            *segment_silence_s* of silence).  Lets callers transcribe
+            segments while recording continues instead of waiting for
+            stop().  Called from the PortAudio thread — hand the segment to
+            an executor, don't process it inline.
+        segment_silence_s:
+            Silence run that closes a segment, in seconds.
+        segment_min_rms:
+            Normalized RMS below which a block counts as silence.
         """
-        self._frames: list[np.ndarray] = []
+        # Preallocated arena the PortAudio callback writes into — avoids a
+        # per-chunk list append plus an O(N) concatenate at stop().
+        self._buf: np.ndarray = np.empty(SAMPLE_RATE * 60, dtype=np.int16)
+        self._n: int = 0
         self._recording: bool = False
         self._stream: Optional[sd.InputStream] = None
         self._on_chunk = on_chunk
-        self._lock = threading.Lock()
+        self._on_segment = on_segment
+        self._seg_silence_samples = int(segment_silence_s * SAMPLE_RATE)
+        self._seg_min_rms = segment_min_rms
+        self._seg_start: int = 0
+        self._seg_silence_run: int = 0
+        self._seg_voiced: bool = False
+        # Level of the most recent block, updated for free by the fused
+        # numba kernel when available (0.0 otherwise).  last_meter pairs
+        # the RMS with the block's abs-peak; both are plain attribute
+        # stores, so the UI thread can read them lock-free.
+        self.last_rms: float = 0.0
+        self.last_meter: tuple[float, float] = (0.0, 0.0)
         # Event set once the stream is fully opened — stop() waits on this
         self._stream_ready = threading.Event()
 
@@ -215,20 +566,22 @@ class Recorder:
         PortAudio stream is open so that stop() can safely close it.
         """
         self.stop()
-        with self._lock:
-            self._frames = []
-            self._recording = True
-            self._stream_ready.clear()
-            self._stream = sd.InputStream(
-                samplerate=samplerate,
-                channels=CHANNELS,
-                dtype="int16",
-                blocksize=BLOCK_SIZE,
-                device=device,
-                callback=self._callback,
-            )
-            self._stream.start()
-            self._stream_ready.set()
+        self._n = 0
+        self._seg_start = 0
+        self._seg_silence_run = 0
+        self._seg_voiced = False
+        self._recording = True
+        self._stream_ready.clear()
+        self._stream = sd.InputStream(
+            samplerate=samplerate,
+            channels=CHANNELS,
+            dtype="int16",
+            blocksize=BLOCK_SIZE,
+            device=device,
+            callback=self._callback,
+        )
+        self._stream.start()
+        self._stream_ready.set()
 
     def stop(self) -> np.ndarray:
         """Stop recording and return the captured audio as int16 mono array.
@@ -239,19 +592,19 @@ class Recorder:
         self._recording = False
         # Wait at most 2 s for the stream to be opened before attempting close
         self._stream_ready.wait(timeout=2.0)
-        with self._lock:
-            if self._stream is not None:
-                try:
-                    self._stream.stop()
-                    self._stream.close()
-                except Exception:
-                    pass
-                finally:
-                    self._stream = None
-            frames = list(self._frames)
-        if frames:
-            return np.concatenate(frames, axis=0).flatten()
-        return np.array([], dtype=np.int16)
+        if self._stream is not None:
+            try:
+                # stream.stop() quiesces the callback; the arena is safe
+                # to read once it returns
+                self._stream.stop()
+                self._stream.close()
+            except Exception:
+                pass
+            finally:
+                self._stream = None
+        # Copy so the returned audio survives the arena being reused
+        # by the next start()
+        return self._buf[:self._n].copy()
 
     # ------------------------------------------------------------------
     # PortAudio callback (runs in audio thread)
@@ -265,22 +618,127 @@ class Recorder:
         status: sd.CallbackFlags,
     ) -> None:
         if self._recording:
-            chunk = indata.copy()
-            self._frames.append(chunk)
+            flat = indata.reshape(-1)  # mono — a free view, not a copy
+            end = self._n + flat.size
+            if end > self._buf.size:
+                # Rare: double the arena (amortized O(N) over a recording)
+                self._buf = np.resize(self._buf, max(self._buf.size * 2, end))
+            if _copy_and_rms is not None:
+                # Fused nopython copy + meter computation, one traversal
+                rms, peak = _copy_and_rms(flat, self._buf, self._n)
+                self.last_rms = min(rms, 1.0)
+                self.last_meter = (self.last_rms, min(peak, 1.0))
+            else:
+                self._buf[self._n:end] = flat
+            self._n = end
             if self._on_chunk is not None:
                 try:
-                    self._on_chunk(chunk.flatten())
+                    # View into the arena — must not outlive the callback
+                    self._on_chunk(self._buf[end - flat.size:end])
+                except Exception:
+                    pass
+            if self._on_segment is not None:
+                self._track_segment(flat, end)
+
+    def _track_segment(self, flat: np.ndarray, end: int) -> None:
+        """Close and emit a speech segment after a long-enough silence run.
+
+        Energy-based approximation of streaming VAD — faster-whisper only
+        exposes batch VAD, so segment boundaries here are cheap RMS runs;
+        the real Silero pass still happens inside transcribe().
+        """
+        level = self.last_rms if _copy_and_rms is not None else rms_level(flat)
+        if level >= self._seg_min_rms:
+            self._seg_voiced = True
+            self._seg_silence_run = 0
+            return
+        self._seg_silence_run += flat.size
+        if self._seg_voiced and self._seg_silence_run >= self._seg_silence_samples:
+            seg_end = end - self._seg_silence_run
+            if seg_end > self._seg_start:
+                try:
+                    self._on_segment(self._buf[self._seg_start:seg_end].copy())
                 except Exception:
                     pass
+            self._seg_start = end
+            self._seg_voiced = False
+            self._seg_silence_run = 0
 
 
 # ---------------------------------------------------------------------------
 # Level meter helper
 # ---------------------------------------------------------------------------
 
+# Optional SIMD backend for the per-chunk level meter; the NumPy fallback
+# squares in the integer domain (int16² fits int32; accumulate in int64)
+# so no float conversion pass touches the chunk.
+try:
+    import numpy_rms as _numpy_rms
+except ImportError:
+    _numpy_rms = None
+
+# Optional numba kernel — a nopython loop over the raw int16 memory with
+# no NumPy dispatch, compiled (and warmed) at import so the PortAudio
+# thread never pays JIT cost.
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+if _numba is not None:
+    # Explicit contiguous signature → compiled eagerly at import, and the
+    # per-call dispatch is a direct jump instead of a type lookup.
+    @_numba.njit("float64(int16[::1])", cache=True, fastmath=True)
+    def _rms_i16(x: np.ndarray) -> float:
+        s = 0
+        for v in x:
+            s += int(v) * int(v)
+        return math.sqrt(s / len(x)) / 32768.0
+
+    # Explicit eager signature: compiled at import and dispatched with a
+    # direct call at SAMPLE_RATE/BLOCK_SIZE Hz on the audio thread.  The
+    # callback always feeds contiguous views of the block and the arena.
+    @_numba.njit(
+        "UniTuple(float64, 2)(int16[::1], int16[::1], int64)",
+        cache=True,
+        fastmath=True,
+    )
+    def _copy_and_rms(flat: np.ndarray, buf: np.ndarray, offset: int):
+        """Copy *flat* into *buf* at *offset* and return its normalized
+        (rms, peak) in the same pass — one traversal instead of three on
+        the audio thread."""
+        s = 0
+        p = 0
+        for i in range(flat.size):
+            v = flat[i]
+            buf[offset + i] = v
+            s += int(v) * int(v)
+            av = -int(v) if v < 0 else int(v)
+            if av > p:
+                p = av
+        return math.sqrt(s / flat.size) / 32768.0, p / 32768.0
+
+else:
+    _rms_i16 = None
+    _copy_and_rms = None
+
+
 def rms_level(chunk: np.ndarray) -> float:
     """Return RMS amplitude in [0, 1] for an int16 audio chunk."""
-    if len(chunk) == 0:
+    # Flatten (n, channels) input up front — a free view when contiguous —
+    # so the 1-D einsum/numba reductions keep the baseline all-samples
+    # semantics for multi-channel chunks.
+    chunk = np.ravel(chunk)
+    if chunk.size == 0:
         return 0.0
-    rms = float(np.sqrt(np.mean(chunk.astype(np.float32) ** 2)))
+    if _rms_i16 is not None:
+        # ravel() guarantees the C-contiguity the signature demands
+        return min(_rms_i16(chunk), 1.0)
+    if _numpy_rms is not None:
+        rms = float(_numpy_rms.rms(chunk))
+    else:
+        # Fused sum-of-squares straight off the int16 input, accumulating
+        # in int64 — no cast copy, no squared temporary
+        ss = np.einsum("i,i->", chunk, chunk, dtype=np.int64)
+        rms = math.sqrt(ss / len(chunk))
     return min(rms / 32768.0, 1.0)
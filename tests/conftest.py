@@ -5,5 +5,18 @@ Shared pytest fixtures for ptt_gui tests.
 import sys
 import os
 
+import pytest
+
 # Make sure the src/ directory is on sys.path so imports work without install.
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+@pytest.fixture(autouse=True)
+def _clear_model_cache():
+    """Keep load_model()'s process-wide cache from leaking between tests."""
+    from ptt_gui import core
+    core._MODEL_CACHE.clear()
+    core._PRELOAD_FUTURE = None
+    yield
+    core._MODEL_CACHE.clear()
+    core._PRELOAD_FUTURE = None
@@ -9,7 +9,12 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from ptt_gui.core import load_model, DEFAULT_WHISPER_MODEL, DEFAULT_LANGUAGE
+from ptt_gui.core import (
+    load_model,
+    preload_model_async,
+    DEFAULT_WHISPER_MODEL,
+    DEFAULT_LANGUAGE,
+)
 
 
 class TestLoadModel:
@@ -23,9 +28,10 @@ class TestLoadModel:
 
         assert result is fake_model
 
+    @patch("ptt_gui.core.shutil.which", return_value=None)
     @patch("ptt_gui.core.WhisperModel")
-    def test_uses_cpu_device(self, mock_cls):
-        """load_model() should request CPU device."""
+    def test_uses_cpu_device(self, mock_cls, _mock_which):
+        """load_model() should request CPU device when no NVIDIA driver exists."""
         mock_cls.return_value = MagicMock()
 
         load_model()
@@ -33,8 +39,9 @@ class TestLoadModel:
         _, kwargs = mock_cls.call_args
         assert kwargs.get("device") == "cpu"
 
+    @patch("ptt_gui.core.shutil.which", return_value=None)
     @patch("ptt_gui.core.WhisperModel")
-    def test_uses_int8_compute_type(self, mock_cls):
+    def test_uses_int8_compute_type(self, mock_cls, _mock_which):
         """load_model() should use int8 quantisation for fastest CPU inference."""
         mock_cls.return_value = MagicMock()
 
@@ -43,6 +50,20 @@ class TestLoadModel:
         _, kwargs = mock_cls.call_args
         assert kwargs.get("compute_type") == "int8"
 
+    @patch("ptt_gui.core.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("ptt_gui.core.WhisperModel")
+    def test_falls_back_to_cpu_when_cuda_load_fails(self, mock_cls, _mock_which):
+        """A CUDA probe hit without cuDNN/cuBLAS should retry on CPU/int8."""
+        fake_model = MagicMock()
+        mock_cls.side_effect = [RuntimeError("cuDNN not found"), fake_model]
+
+        result = load_model()
+
+        assert result is fake_model
+        _, kwargs = mock_cls.call_args
+        assert kwargs.get("device") == "cpu"
+        assert kwargs.get("compute_type") == "int8"
+
     @patch("ptt_gui.core.WhisperModel")
     def test_default_model_size(self, mock_cls):
         """load_model() should use DEFAULT_WHISPER_MODEL ('base') by default."""
@@ -84,6 +105,18 @@ class TestLoadModel:
 
         assert result.language == "en"
 
+    @patch("ptt_gui.core.WhisperModel")
+    def test_preload_model_async_returns_future_that_yields_model(self, mock_cls):
+        """preload_model_async() should return a Future resolving to the model."""
+        fake_model = MagicMock()
+        mock_cls.return_value = fake_model
+
+        future = preload_model_async()
+
+        assert future.result(timeout=5) is fake_model
+        # A second call shares the same in-flight future
+        assert preload_model_async() is future
+
     def test_default_whisper_model_is_defined(self):
         """DEFAULT_WHISPER_MODEL should be a non-empty string."""
         assert DEFAULT_WHISPER_MODEL
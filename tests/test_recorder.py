@@ -16,9 +16,14 @@ from ptt_gui.core import Recorder, SAMPLE_RATE, CHANNELS, BLOCK_SIZE
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Seeded PCG64 generator — deterministic and safe under parallel workers,
+# unlike the legacy global Mersenne Twister state.
+_rng = np.random.default_rng(0)
+
+
 def _make_chunk(n: int = BLOCK_SIZE) -> np.ndarray:
     """Return a random int16 chunk shaped (n, CHANNELS)."""
-    return (np.random.rand(n, CHANNELS) * 16000).astype(np.int16)
+    return (_rng.random((n, CHANNELS)) * 16000).astype(np.int16)
 
 
 def _make_recorder_with_mock_stream(stream_mock=None):
@@ -137,6 +142,28 @@ class TestRecorder:
         audio = rec.stop()    # should not raise
         assert isinstance(audio, np.ndarray)
 
+    @patch("ptt_gui.core.sd.InputStream")
+    def test_on_segment_fires_after_silence_run(self, mock_cls):
+        mock_cls.return_value = MagicMock()
+        segments = []
+        rec = Recorder(
+            on_segment=lambda s: segments.append(s),
+            segment_silence_s=0.2,
+        )
+        rec.start()
+
+        # One loud chunk followed by enough silence to close the segment
+        loud = np.full((BLOCK_SIZE, CHANNELS), 8000, dtype=np.int16)
+        silence = np.zeros((BLOCK_SIZE, CHANNELS), dtype=np.int16)
+        rec._callback(loud, BLOCK_SIZE, None, MagicMock())
+        for _ in range(8):  # 8 * 1024 samples > 0.2 s at 16 kHz
+            rec._callback(silence, BLOCK_SIZE, None, MagicMock())
+        rec.stop()
+
+        assert len(segments) == 1
+        assert segments[0].dtype == np.int16
+        assert len(segments[0]) >= BLOCK_SIZE
+
     @patch("ptt_gui.core.sd.InputStream")
     def test_audio_concatenated_correctly(self, mock_cls):
         mock_cls.return_value = MagicMock()